@@ -41,16 +41,31 @@ def test_table_parameters():
     assert 30.0 in velocities
 
 
+def test_table_columns():
+    """Test per-column access to table parameters."""
+    from vehicle_params_py import (
+        BRAKING_DISTANCE_TABLE_BRAKING_DISTANCE_VALUES,
+        BRAKING_DISTANCE_TABLE_DATA,
+        BRAKING_DISTANCE_TABLE_VELOCITY_VALUES,
+    )
+
+    # Columns line up with the rows
+    assert len(BRAKING_DISTANCE_TABLE_VELOCITY_VALUES) == len(BRAKING_DISTANCE_TABLE_DATA)
+    assert BRAKING_DISTANCE_TABLE_VELOCITY_VALUES[0] == 10.0
+    assert BRAKING_DISTANCE_TABLE_BRAKING_DISTANCE_VALUES[-1] == 150.0
+    assert BRAKING_DISTANCE_TABLE_VELOCITY_VALUES == tuple(row.velocity for row in BRAKING_DISTANCE_TABLE_DATA)
+
+
 def test_table_immutability():
-    """Test that table rows are immutable (frozen dataclass)."""
+    """Test that table rows are immutable (NamedTuple)."""
     from vehicle_params_py import BRAKING_DISTANCE_TABLE_DATA
 
     first_row = BRAKING_DISTANCE_TABLE_DATA[0]
 
-    # Try to modify a field (should raise error due to frozen=True)
+    # Try to modify a field (should raise error since rows are tuples)
     try:
         first_row.velocity = 999.0
-        assert False, "Should not be able to modify frozen dataclass"
+        assert False, "Should not be able to modify table row"
     except AttributeError:
         pass  # Expected
 
@@ -58,5 +73,6 @@ def test_table_immutability():
 if __name__ == "__main__":
     test_simple_parameters()
     test_table_parameters()
+    test_table_columns()
     test_table_immutability()
     print("All Python parameter tests passed!")
@@ -1,7 +1,36 @@
 """C++ code generation."""
 
+load(":validator.bzl", "validator")
+
+# Skeleton of a generated header. The file frame is rendered once per header;
+# per-parameter declarations are spliced into {body}.
+_HEADER_TEMPLATE = """#ifndef {header_guard}
+#define {header_guard}
+
+#include <array>
+#include <cstddef>  // for size_t
+
+{namespace_open}
+
+{body}{namespace_close}
+
+#endif // {header_guard}"""
+
+# Parameter type to C++ type, built once when the module is loaded
+_CPP_TYPES = {
+    "boolean": "bool",
+    "float": "double",
+    "integer": "int",
+    "string": "const char*",
+}
+
 def _to_pascal_case(snake_case):
     """Convert snake_case to PascalCase."""
+
+    # Single-word names need no split/join. str.title() is not used because
+    # it also capitalizes letters after digits ("gear2ratio" -> "Gear2Ratio").
+    if "_" not in snake_case:
+        return snake_case.capitalize()
     parts = snake_case.split("_")
     return "".join([part.capitalize() for part in parts])
 
@@ -9,56 +38,58 @@ def _to_upper_case(snake_case):
     """Convert snake_case to UPPER_CASE (C++ constant naming convention)."""
     return snake_case.upper()
 
+def _format_cpp_float(value):
+    """Format a float value for C++ code."""
+
+    # Ensure float formatting
+    return str(float(value))
+
+def _format_cpp_string(value):
+    """Format a string value for C++ code."""
+
+    # Escape special characters; most values contain none, so skip the
+    # replace passes for them
+    if "\\" in value or '"' in value:
+        value = value.replace("\\", "\\\\").replace('"', '\\"')
+    return '"' + value + '"'
+
+def _format_cpp_boolean(value):
+    """Format a boolean value for C++ code."""
+    return "true" if value else "false"
+
+# Value formatter for each parameter type
+_CPP_FORMATTERS = {
+    "boolean": _format_cpp_boolean,
+    "float": _format_cpp_float,
+    "integer": str,
+    "string": _format_cpp_string,
+}
+
+def _get_cpp_formatter(param_type):
+    """Get the value formatter for a parameter type."""
+    formatter = _CPP_FORMATTERS.get(param_type)
+    if not formatter:
+        fail("Unknown parameter type: {}".format(param_type))
+    return formatter
+
 def _format_cpp_value(value, param_type):
     """Format a value for C++ code."""
-    if param_type == "float":
-        # Ensure float formatting
-        return str(float(value))
-    elif param_type == "integer":
-        return str(value)
-    elif param_type == "string":
-        # Escape special characters
-        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
-        return '"{}"'.format(escaped)
-    elif param_type == "boolean":
-        return "true" if value else "false"
-    else:
-        fail("Unknown parameter type: {}".format(param_type))
+    return _get_cpp_formatter(param_type)(value)
 
-def _get_cpp_type(param_type):
-    """Get C++ type for parameter type."""
-    type_map = {
-        "boolean": "bool",
-        "float": "double",
-        "integer": "int",
-        "string": "const char*",
-    }
-    return type_map.get(param_type, "unknown")
-
-def _generate_header_guard(namespace):
-    """Generate header guard name from namespace."""
-    return namespace.replace(".", "_").upper() + "_PARAMS_H"
-
-def _generate_namespace_open(namespace):
-    """Generate namespace opening statements."""
-    lines = []
-    parts = namespace.split(".")
-    for part in parts:
-        lines.append("namespace {} {{".format(part))
-    return lines
+def _generate_header_guard(parts):
+    """Generate header guard name from namespace parts."""
+    return "_".join(parts).upper() + "_PARAMS_H"
 
-def _generate_namespace_close(namespace):
-    """Generate namespace closing statements."""
-    lines = []
-    parts = namespace.split(".")
-    for part in reversed(parts):
-        lines.append("}} // namespace {}".format(part))
-    return lines
+def _generate_namespace_open(parts):
+    """Generate namespace opening statements as a single block."""
+    return "namespace " + " {\nnamespace ".join(parts) + " {"
 
-def _generate_simple_parameter(param):
-    """Generate C++ code for a simple (non-table) parameter."""
-    lines = []
+def _generate_namespace_close(parts):
+    """Generate namespace closing statements as a single block."""
+    return "} // namespace " + "\n} // namespace ".join(reversed(parts))
 
+def _generate_simple_parameter(param, lines):
+    """Append C++ code for a simple (non-table) parameter to lines."""
     param_name = param["name"]
     param_type = param["type"]
     value = param["value"]
@@ -76,17 +107,13 @@ def _generate_simple_parameter(param):
         lines.append("/// {}".format(" - ".join(comment_parts)))
 
     # Generate declaration using UPPER_CASE constant naming convention
-    cpp_type = _get_cpp_type(param_type)
+    cpp_type = _CPP_TYPES.get(param_type, "unknown")
     cpp_value = _format_cpp_value(value, param_type)
     const_name = _to_upper_case(param_name)
     lines.append("constexpr {} {} = {};".format(cpp_type, const_name, cpp_value))
 
-    return lines
-
-def _generate_table_parameter(param):
-    """Generate C++ code for a table parameter."""
-    lines = []
-
+def _generate_table_parameter(param, lines):
+    """Append C++ code for a table parameter to lines."""
     param_name = param["name"]
     description = param.get("description", "")
     columns = param["columns"]
@@ -101,7 +128,7 @@ def _generate_table_parameter(param):
     for col in columns:
         col_name = col["name"]
         col_type = col["type"]
-        cpp_type = _get_cpp_type(col_type)
+        cpp_type = _CPP_TYPES.get(col_type, "unknown")
         col_unit = col.get("unit", "")
 
         # Add field documentation
@@ -117,32 +144,43 @@ def _generate_table_parameter(param):
     const_name = _to_upper_case(param_name)
     if description:
         lines.append("/// {}".format(description))
-    lines.append("constexpr {} {}[] = {{".format(struct_name, const_name))
+    lines.append("constexpr std::array<{}, {}> {} = {{{{".format(struct_name, len(rows), const_name))
+
+    # Resolve each column's formatter once instead of dispatching per cell,
+    # and specialize the row initializer format to this table's column count
+    formatters = [_get_cpp_formatter(col["type"]) for col in columns]
+    row_template = "    {{" + ", ".join(["{}"] * len(columns)) + "}},"
 
     # Generate rows
     for row in rows:
-        row_values = []
-        for cell, col in zip(row, columns):
-            formatted_value = _format_cpp_value(cell, col["type"])
-            row_values.append(formatted_value)
-
-        lines.append("    {{{}}},".format(", ".join(row_values)))
+        lines.append(row_template.format(*[
+            format_value(cell)
+            for format_value, cell in zip(formatters, row)
+        ]))
 
-    lines.append("};")
+    lines.append("}};")
     lines.append("")
 
     # Generate size constant using UPPER_CASE constant naming convention
     lines.append("/// Number of rows in {}".format(const_name))
     lines.append("constexpr size_t {}_SIZE = {};".format(const_name, len(rows)))
 
-    return lines
-
-def _generate_parameter(param):
-    """Generate C++ code for a single parameter."""
+def _generate_parameter(param, lines):
+    """Append C++ code for a single parameter to lines."""
     if param["type"] == "table":
-        return _generate_table_parameter(param)
+        _generate_table_parameter(param, lines)
     else:
-        return _generate_simple_parameter(param)
+        _generate_simple_parameter(param, lines)
+
+def _render_header(namespace, lines):
+    """Render the header frame around the generated parameter lines."""
+    parts = namespace.split(".")
+    return _HEADER_TEMPLATE.format(
+        header_guard = _generate_header_guard(parts),
+        namespace_open = _generate_namespace_open(parts),
+        body = "\n".join(lines) + "\n" if lines else "",
+        namespace_close = _generate_namespace_close(parts),
+    )
 
 def generate_cpp_header(param_data):
     """Generate C++ header file content from parameter data.
@@ -153,40 +191,46 @@ def generate_cpp_header(param_data):
     Returns:
         String containing C++ header file content
     """
+
+    # All parameters write into one line buffer that is joined exactly once;
+    # each parameter block is followed by a blank line
     lines = []
+    for param in param_data["parameters"]:
+        _generate_parameter(param, lines)
+        lines.append("")
 
-    namespace = param_data["namespace"]
-    parameters = param_data["parameters"]
+    return _render_header(param_data["namespace"], lines)
 
-    # Generate header guard
-    header_guard = _generate_header_guard(namespace)
-    lines.append("#ifndef {}".format(header_guard))
-    lines.append("#define {}".format(header_guard))
-    lines.append("")
+def generate_validated_cpp_header(param_data):
+    """Validate parameter data and generate the C++ header in one pass.
 
-    # Add includes
-    lines.append("#include <cstddef>  // for size_t")
-    lines.append("")
+    Each parameter is validated right before its code is emitted, so the
+    parameter list is walked once instead of once per step.
 
-    # Generate namespace opening
-    lines.extend(_generate_namespace_open(namespace))
-    lines.append("")
-
-    # Generate parameters
-    for param in parameters:
-        lines.extend(_generate_parameter(param))
-        lines.append("")
+    Args:
+        param_data: Dictionary with parameter data
 
-    # Generate namespace closing
-    lines.extend(_generate_namespace_close(namespace))
-    lines.append("")
+    Returns:
+        Tuple of (header content, error message). The content is None if
+        validation failed, the error message is None otherwise.
+    """
+    err = validator.validate_header(param_data)
+    if err:
+        return None, err
 
-    # Close header guard
-    lines.append("#endif // {}".format(header_guard))
+    lines = []
+    seen_names = {}
+    for index, param in enumerate(param_data["parameters"]):
+        err = validator.validate_parameter(param, index, seen_names)
+        if err:
+            return None, err
+        _generate_parameter(param, lines)
+        lines.append("")
 
-    return "\n".join(lines)
+    return _render_header(param_data["namespace"], lines), None
 
-# Export generator function
+# Export generator functions
 cpp_generator = struct(
     generate = generate_cpp_header,
+    generate_validated = generate_validated_cpp_header,
 )
@@ -151,7 +151,7 @@ def _test_table_parameter(ctx):
 
     # Check array declaration
     asserts.true(env, "/// Gear ratios" in result, "Should have description comment")
-    asserts.true(env, "constexpr GearRatiosRow GEAR_RATIOS[] = {" in result, "Should have array declaration with UPPER_CASE")
+    asserts.true(env, "constexpr std::array<GearRatiosRow, 2> GEAR_RATIOS = {{" in result, "Should have array declaration with UPPER_CASE")
     asserts.true(env, "{1, 3.5, 40.0}," in result, "Should have first row")
     asserts.true(env, "{2, 2.1, 70.0}," in result, "Should have second row")
 
@@ -246,6 +246,45 @@ def _test_multiple_parameters(ctx):
 
     return unittest.end(env)
 
+def _test_generate_validated(ctx):
+    """Test fused validation and C++ generation."""
+    env = unittest.begin(ctx)
+
+    param_data = {
+        "namespace": "test",
+        "parameters": [
+            {
+                "description": "Number of wheels",
+                "name": "wheel_count",
+                "type": "integer",
+                "value": 4,
+            },
+        ],
+        "schema_version": "1.0",
+    }
+
+    result, err = cpp_generator.generate_validated(param_data)
+    asserts.equals(env, None, err)
+    asserts.equals(env, cpp_generator.generate(param_data), result)
+
+    # Invalid parameter is reported instead of generated
+    param_data["parameters"].append({
+        "description": "Bad value",
+        "name": "bad",
+        "type": "integer",
+        "value": "four",
+    })
+    result, err = cpp_generator.generate_validated(param_data)
+    asserts.equals(env, None, result)
+    asserts.equals(env, "parameter 'bad' must be an integer (got string)", err)
+
+    # Duplicate names are rejected
+    param_data["parameters"][1] = param_data["parameters"][0]
+    result, err = cpp_generator.generate_validated(param_data)
+    asserts.equals(env, "duplicate parameter name: wheel_count", err)
+
+    return unittest.end(env)
+
 # Test suite
 simple_float_parameter_test = unittest.make(_test_simple_float_parameter)
 simple_integer_parameter_test = unittest.make(_test_simple_integer_parameter)
@@ -257,6 +296,7 @@ string_escaping_test = unittest.make(_test_string_escaping)
 header_guard_format_test = unittest.make(_test_header_guard_format)
 includes_size_t_test = unittest.make(_test_includes_size_t)
 multiple_parameters_test = unittest.make(_test_multiple_parameters)
+generate_validated_test = unittest.make(_test_generate_validated)
 
 def cpp_generator_test_suite(name):
     """Create test suite for cpp_generator."""
@@ -272,4 +312,5 @@ def cpp_generator_test_suite(name):
         header_guard_format_test,
         includes_size_t_test,
         multiple_parameters_test,
+        generate_validated_test,
     )
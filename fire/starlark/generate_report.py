@@ -1,10 +1,97 @@
 #!/usr/bin/env python3
 """Generate requirement reports from markdown files."""
 
-import sys
+import argparse
 import re
 from pathlib import Path
 
+# Reference lists that may appear under a requirement's "references" mapping
+REFERENCE_KINDS = ("parameters", "requirements", "tests", "standards")
+
+# Static report layout, joined once at import. Each block is one entry in a
+# report's line list; only per-requirement rows are formatted at run time.
+_TRACEABILITY_PARAMETERS_HEADER = "\n".join([
+    "# Traceability Matrix",
+    "",
+    "## Requirements → Parameters",
+    "",
+    "| Requirement | Title | Parameters |",
+    "|-------------|-------|------------|",
+])
+
+_TRACEABILITY_REQUIREMENTS_HEADER = "\n".join([
+    "",
+    "## Requirements → Requirements",
+    "",
+    "| Requirement | Version | Title | Parent Requirements (Version) |",
+    "|-------------|---------|-------|-------------------------------|",
+])
+
+_TRACEABILITY_TESTS_HEADER = "\n".join([
+    "",
+    "## Requirements → Tests",
+    "",
+    "| Requirement | Title | Tests |",
+    "|-------------|-------|-------|",
+])
+
+_TRACEABILITY_STANDARDS_HEADER = "\n".join([
+    "",
+    "## Requirements → Standards",
+    "",
+    "| Requirement | Title | Standards |",
+    "|-------------|-------|-----------|",
+])
+
+_COVERAGE_INTRO = "\n".join([
+    "# Traceability Coverage Report",
+    "",
+    "This report shows which requirements have references to parameters, tests, and standards.",
+    "Note: 'Linked Tests' indicates requirements with test references in frontmatter, not verified test execution.",
+    "",
+])
+
+_CHANGE_IMPACT_INTRO = "\n".join([
+    "# Change Impact Analysis",
+    "",
+    "This report identifies requirements that may need review due to parent requirement changes.",
+    "",
+])
+
+_CHANGE_IMPACT_STALE_HEADER = "\n".join([
+    "## ⚠️ Requirements with Stale Parent References",
+    "",
+    "The following requirements track parent versions that have changed:",
+    "",
+])
+
+_CHANGE_IMPACT_ACTION_REQUIRED = "\n".join([
+    "",
+    "**Action Required**: Review and update this requirement to align with parent changes, then update the parent version reference.",
+    "",
+])
+
+_CHANGE_IMPACT_UP_TO_DATE = "\n".join([
+    "## ✅ All Requirements Up-to-Date",
+    "",
+    "No requirements found with stale parent references. All tracked parent versions match current versions.",
+    "",
+])
+
+_COMPLIANCE_STATUS_HEADER = "\n".join([
+    "## Requirements by Status",
+    "",
+    "| Status | Count |",
+    "|--------|-------|",
+])
+
+_COMPLIANCE_NOT_VERIFIED_HEADER = "\n".join([
+    "### Requirements Not Yet Verified",
+    "",
+    "| Requirement | Title | Type | Current Status |",
+    "|-------------|-------|------|----------------|",
+])
+
 
 def parse_simple_yaml(yaml_text):
     """Simple YAML parser for requirement frontmatter."""
@@ -14,11 +101,12 @@ def parse_simple_yaml(yaml_text):
     # Parse into a list of (indent, key, value, is_list_item) tuples
     parsed_lines = []
     for line in lines:
-        if not line.strip() or line.strip().startswith('#'):
+        # Strip once per line; blank lines and comments are skipped
+        stripped = line.strip()
+        if not stripped or stripped[0] == '#':
             continue
 
         indent = len(line) - len(line.lstrip())
-        stripped = line.strip()
 
         if stripped.startswith('- '):
             item = stripped[2:].strip()
@@ -133,111 +221,141 @@ def parse_simple_yaml(yaml_text):
 
 def parse_requirement_file(file_path):
     """Parse a requirement markdown file and extract frontmatter."""
-    with open(file_path, 'r') as f:
+    with open(file_path, 'rb') as f:
         content = f.read()
 
-    # Find frontmatter boundaries
-    lines = content.split('\n')
-    first_delimiter = None
-    second_delimiter = None
+    # Universal newlines, as text mode would give: CRLF and lone CR become LF
+    if b'\r' in content:
+        content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+    return parse_requirement_content(content)
+
+
+def _find_delimiter_line(content, start):
+    """Find the next line at or after start that is '---' once stripped.
 
-    for i, line in enumerate(lines):
-        if line.strip() == '---':
-            if first_delimiter is None:
-                first_delimiter = i
-            elif second_delimiter is None:
-                second_delimiter = i
-                break
+    content may be str or bytes. Returns (line_start, line_end) offsets into
+    content, where line_end is the position of the terminating newline (or the
+    end of content), or None.
+    """
+    if isinstance(content, bytes):
+        delimiter, newline = b'---', b'\n'
+    else:
+        delimiter, newline = '---', '\n'
+
+    pos = content.find(delimiter, start)
+    while pos != -1:
+        line_start = content.rfind(newline, 0, pos) + 1
+        line_end = content.find(newline, pos)
+        if line_end == -1:
+            line_end = len(content)
+        if content[line_start:line_end].strip() == delimiter:
+            return line_start, line_end
+        pos = content.find(delimiter, line_end)
+    return None
+
+
+def parse_requirement_content(content):
+    """Extract (id, frontmatter) from requirement markdown content.
+
+    content may be str or UTF-8 bytes; for bytes, only the frontmatter is decoded.
+    """
+    # Find frontmatter boundaries by scanning for delimiters in place, without
+    # splitting the whole document (including its body) into lines
+    first_delimiter = _find_delimiter_line(content, 0)
+    if first_delimiter is None:
+        return None
 
-    if first_delimiter is None or second_delimiter is None:
+    second_delimiter = _find_delimiter_line(content, first_delimiter[1])
+    if second_delimiter is None:
         return None
 
     # Extract and parse frontmatter
-    frontmatter_lines = lines[first_delimiter + 1:second_delimiter]
-    frontmatter_text = '\n'.join(frontmatter_lines)
+    frontmatter_text = content[first_delimiter[1] + 1:second_delimiter[0]]
+    if isinstance(frontmatter_text, bytes):
+        frontmatter_text = frontmatter_text.decode('utf-8')
 
     frontmatter = parse_simple_yaml(frontmatter_text)
 
     if not frontmatter or 'id' not in frontmatter:
         return None
 
-    return (frontmatter['id'], frontmatter)
+    return (frontmatter['id'], normalize_frontmatter(frontmatter))
+
+
+def normalize_frontmatter(frontmatter):
+    """Give frontmatter a "references" mapping holding every REFERENCE_KINDS list.
+
+    Missing or empty kinds become empty lists, as do all kinds when
+    "references" is missing or not a mapping. Reports rely on this and read
+    reference lists without further checks.
+    """
+    references = frontmatter.get("references")
+    normalized = dict(references) if isinstance(references, dict) else {}
+    for kind in REFERENCE_KINDS:
+        normalized[kind] = normalized.get(kind) or []
+    frontmatter["references"] = normalized
+    return frontmatter
+
+
+def index_references(requirements_data):
+    """Resolve each requirement's title and references in a single pass.
+
+    Expects frontmatter as returned by parse_requirement_content, i.e. passed
+    through normalize_frontmatter. Returns a list of (req_id, title,
+    frontmatter, refs) tuples, where title defaults to an empty string and refs
+    is the normalized "references" mapping.
+    """
+    return [
+        (req_id, frontmatter.get("title", ""), frontmatter, frontmatter["references"])
+        for req_id, frontmatter in requirements_data
+    ]
+
+
+def percentage(count, total):
+    """Integer percentage of count in total, or 0 when total is 0."""
+    return (count * 100) // total if total else 0
 
 
 def generate_traceability_matrix(requirements_data):
     """Generate traceability matrix in markdown."""
-    lines = []
-    lines.append("# Traceability Matrix")
-    lines.append("")
-    lines.append("## Requirements → Parameters")
-    lines.append("")
-    lines.append("| Requirement | Title | Parameters |")
-    lines.append("|-------------|-------|------------|")
+    lines = [_TRACEABILITY_PARAMETERS_HEADER]
 
-    for req_id, frontmatter in requirements_data:
-        title = frontmatter.get("title", "")
-        params = []
-        if "references" in frontmatter and isinstance(frontmatter["references"], dict):
-            if "parameters" in frontmatter["references"]:
-                params = frontmatter["references"]["parameters"]
+    indexed = index_references(requirements_data)
 
+    for req_id, title, frontmatter, refs in indexed:
+        params = refs["parameters"]
         params_str = ", ".join([f"`{p}`" for p in params]) if params else "-"
         lines.append(f"| {req_id} | {title} | {params_str} |")
 
-    lines.append("")
-    lines.append("## Requirements → Requirements")
-    lines.append("")
-    lines.append("| Requirement | Version | Title | Parent Requirements (Version) |")
-    lines.append("|-------------|---------|-------|-------------------------------|")
+    lines.append(_TRACEABILITY_REQUIREMENTS_HEADER)
 
-    for req_id, frontmatter in requirements_data:
-        title = frontmatter.get("title", "")
+    for req_id, title, frontmatter, refs in indexed:
         version = frontmatter.get("version", "-")
         reqs = []
-        if "references" in frontmatter and isinstance(frontmatter["references"], dict):
-            if "requirements" in frontmatter["references"]:
-                req_refs = frontmatter["references"]["requirements"]
-                for ref in req_refs:
-                    if isinstance(ref, str):
-                        reqs.append(ref)
-                    elif isinstance(ref, dict) and "id" in ref:
-                        if "version" in ref:
-                            reqs.append(f"{ref['id']} (v{ref['version']})")
-                        else:
-                            reqs.append(ref["id"])
+        for ref in refs["requirements"]:
+            if isinstance(ref, str):
+                reqs.append(ref)
+            elif isinstance(ref, dict) and "id" in ref:
+                if "version" in ref:
+                    reqs.append(f"{ref['id']} (v{ref['version']})")
+                else:
+                    reqs.append(ref["id"])
 
         reqs_str = ", ".join(reqs) if reqs else "-"
         lines.append(f"| {req_id} | {version} | {title} | {reqs_str} |")
 
-    lines.append("")
-    lines.append("## Requirements → Tests")
-    lines.append("")
-    lines.append("| Requirement | Title | Tests |")
-    lines.append("|-------------|-------|-------|")
-
-    for req_id, frontmatter in requirements_data:
-        title = frontmatter.get("title", "")
-        tests = []
-        if "references" in frontmatter and isinstance(frontmatter["references"], dict):
-            if "tests" in frontmatter["references"]:
-                tests = frontmatter["references"]["tests"]
+    lines.append(_TRACEABILITY_TESTS_HEADER)
 
+    for req_id, title, frontmatter, refs in indexed:
+        tests = refs["tests"]
         tests_str = ", ".join([f"`{t}`" for t in tests]) if tests else "-"
         lines.append(f"| {req_id} | {title} | {tests_str} |")
 
-    lines.append("")
-    lines.append("## Requirements → Standards")
-    lines.append("")
-    lines.append("| Requirement | Title | Standards |")
-    lines.append("|-------------|-------|-----------|")
-
-    for req_id, frontmatter in requirements_data:
-        title = frontmatter.get("title", "")
-        standards = []
-        if "references" in frontmatter and isinstance(frontmatter["references"], dict):
-            if "standards" in frontmatter["references"]:
-                standards = frontmatter["references"]["standards"]
+    lines.append(_TRACEABILITY_STANDARDS_HEADER)
 
+    for req_id, title, frontmatter, refs in indexed:
+        standards = refs["standards"]
         standards_str = "<br>".join(standards) if standards else "-"
         lines.append(f"| {req_id} | {title} | {standards_str} |")
 
@@ -246,77 +364,62 @@ def generate_traceability_matrix(requirements_data):
 
 def generate_coverage_report(requirements_data):
     """Generate coverage report in markdown."""
-    lines = []
-    lines.append("# Traceability Coverage Report")
-    lines.append("")
-    lines.append("This report shows which requirements have references to parameters, tests, and standards.")
-    lines.append("Note: 'Linked Tests' indicates requirements with test references in frontmatter, not verified test execution.")
-    lines.append("")
+    lines = [_COVERAGE_INTRO]
+
+    indexed = index_references(requirements_data)
 
     total_reqs = len(requirements_data)
     reqs_with_params = 0
     reqs_with_tests = 0
     reqs_with_standards = 0
 
-    for _, frontmatter in requirements_data:
-        if "references" in frontmatter and isinstance(frontmatter["references"], dict):
-            refs = frontmatter["references"]
-            if "parameters" in refs and refs["parameters"]:
-                reqs_with_params += 1
-            if "tests" in refs and refs["tests"]:
-                reqs_with_tests += 1
-            if "standards" in refs and refs["standards"]:
-                reqs_with_standards += 1
-
-    param_coverage = (reqs_with_params * 100) // total_reqs if total_reqs > 0 else 0
-    test_coverage = (reqs_with_tests * 100) // total_reqs if total_reqs > 0 else 0
-    standard_coverage = (reqs_with_standards * 100) // total_reqs if total_reqs > 0 else 0
-
-    lines.append("## Summary")
-    lines.append("")
-    lines.append("| Metric | Count | Percentage |")
-    lines.append("|--------|-------|------------|")
-    lines.append(f"| Total Requirements | {total_reqs} | 100% |")
-    lines.append(f"| Requirements with Parameter References | {reqs_with_params} | {param_coverage}% |")
-    lines.append(f"| Requirements with Linked Tests | {reqs_with_tests} | {test_coverage}% |")
-    lines.append(f"| Requirements with Standard References | {reqs_with_standards} | {standard_coverage}% |")
-    lines.append("")
+    for _, _, _, refs in indexed:
+        if refs["parameters"]:
+            reqs_with_params += 1
+        if refs["tests"]:
+            reqs_with_tests += 1
+        if refs["standards"]:
+            reqs_with_standards += 1
+
+    param_coverage = percentage(reqs_with_params, total_reqs)
+    test_coverage = percentage(reqs_with_tests, total_reqs)
+    standard_coverage = percentage(reqs_with_standards, total_reqs)
+
+    lines.extend([
+        "## Summary",
+        "",
+        "| Metric | Count | Percentage |",
+        "|--------|-------|------------|",
+        f"| Total Requirements | {total_reqs} | 100% |",
+        f"| Requirements with Parameter References | {reqs_with_params} | {param_coverage}% |",
+        f"| Requirements with Linked Tests | {reqs_with_tests} | {test_coverage}% |",
+        f"| Requirements with Standard References | {reqs_with_standards} | {standard_coverage}% |",
+        "",
+    ])
 
     # Requirements without parameter references
-    lines.append("## Requirements without Parameter References")
-    lines.append("")
+    lines.extend(["## Requirements without Parameter References", ""])
     missing_params = []
-    for req_id, frontmatter in requirements_data:
-        has_params = False
-        if "references" in frontmatter and isinstance(frontmatter["references"], dict):
-            if "parameters" in frontmatter["references"] and frontmatter["references"]["parameters"]:
-                has_params = True
-        if not has_params:
-            missing_params.append((req_id, frontmatter.get("title", "")))
+    for req_id, title, _, refs in indexed:
+        if not refs["parameters"]:
+            missing_params.append((req_id, title))
 
     if missing_params:
-        for req_id, title in missing_params:
-            lines.append(f"- **{req_id}**: {title}")
+        lines.extend(f"- **{req_id}**: {title}" for req_id, title in missing_params)
     else:
         lines.append("*All requirements have parameter references*")
 
     lines.append("")
 
     # Requirements without linked tests
-    lines.append("## Requirements without Linked Tests")
-    lines.append("")
+    lines.extend(["## Requirements without Linked Tests", ""])
     missing_tests = []
-    for req_id, frontmatter in requirements_data:
-        has_tests = False
-        if "references" in frontmatter and isinstance(frontmatter["references"], dict):
-            if "tests" in frontmatter["references"] and frontmatter["references"]["tests"]:
-                has_tests = True
-        if not has_tests:
-            missing_tests.append((req_id, frontmatter.get("title", "")))
+    for req_id, title, _, refs in indexed:
+        if not refs["tests"]:
+            missing_tests.append((req_id, title))
 
     if missing_tests:
-        for req_id, title in missing_tests:
-            lines.append(f"- **{req_id}**: {title}")
+        lines.extend(f"- **{req_id}**: {title}" for req_id, title in missing_tests)
     else:
         lines.append("*All requirements have linked tests*")
 
@@ -325,136 +428,121 @@ def generate_coverage_report(requirements_data):
 
 def generate_change_impact(requirements_data):
     """Generate change impact analysis in markdown."""
-    lines = []
-    lines.append("# Change Impact Analysis")
-    lines.append("")
-    lines.append("This report identifies requirements that may need review due to parent requirement changes.")
-    lines.append("")
+    lines = [_CHANGE_IMPACT_INTRO]
 
     # Build version map
-    req_versions = {}
-    for req_id, frontmatter in requirements_data:
-        if "version" in frontmatter:
-            req_versions[req_id] = frontmatter["version"]
+    req_versions = {
+        req_id: frontmatter["version"]
+        for req_id, frontmatter in requirements_data
+        if "version" in frontmatter
+    }
 
-    # Find stale requirements
+    # Find stale requirements as (id, version, title, [(parent, tracked, current)])
     stale_requirements = []
-    for req_id, frontmatter in requirements_data:
-        if "references" not in frontmatter or not isinstance(frontmatter["references"], dict):
-            continue
-        if "requirements" not in frontmatter["references"]:
-            continue
-
-        req_refs = frontmatter["references"]["requirements"]
-        stale_parents = []
-
-        for ref in req_refs:
-            if isinstance(ref, dict) and "id" in ref and "version" in ref:
-                parent_id = ref["id"]
-                tracked_version = ref["version"]
-
-                if parent_id in req_versions:
-                    current_version = req_versions[parent_id]
-                    if current_version != tracked_version:
-                        stale_parents.append({
-                            "id": parent_id,
-                            "tracked": tracked_version,
-                            "current": current_version,
-                        })
+    for req_id, title, frontmatter, refs in index_references(requirements_data):
+        stale_parents = [
+            (ref["id"], ref["version"], req_versions[ref["id"]])
+            for ref in refs["requirements"]
+            if isinstance(ref, dict)
+            and "id" in ref
+            and "version" in ref
+            and ref["id"] in req_versions
+            and req_versions[ref["id"]] != ref["version"]
+        ]
 
         if stale_parents:
-            stale_requirements.append({
-                "id": req_id,
-                "title": frontmatter.get("title", ""),
-                "version": frontmatter.get("version", "-"),
-                "stale_parents": stale_parents,
-            })
+            stale_requirements.append((
+                req_id,
+                frontmatter.get("version", "-"),
+                title,
+                stale_parents,
+            ))
 
     if stale_requirements:
-        lines.append("## ⚠️ Requirements with Stale Parent References")
-        lines.append("")
-        lines.append("The following requirements track parent versions that have changed:")
-        lines.append("")
-
-        for req in stale_requirements:
-            lines.append(f"### {req['id']} (v{req['version']})")
-            lines.append("")
-            lines.append(f"**Title**: {req['title']}")
-            lines.append("")
-            lines.append("**Stale Parent References**:")
-            lines.append("")
-            for parent in req["stale_parents"]:
-                lines.append(f"- **{parent['id']}**: Tracking v{parent['tracked']}, but current version is v{parent['current']}")
-            lines.append("")
-            lines.append("**Action Required**: Review and update this requirement to align with parent changes, then update the parent version reference.")
-            lines.append("")
+        lines.append(_CHANGE_IMPACT_STALE_HEADER)
+
+        for req_id, version, title, stale_parents in stale_requirements:
+            lines.extend([
+                f"### {req_id} (v{version})",
+                "",
+                f"**Title**: {title}",
+                "",
+                "**Stale Parent References**:",
+                "",
+            ])
+            lines.extend(
+                f"- **{parent_id}**: Tracking v{tracked}, but current version is v{current}"
+                for parent_id, tracked, current in stale_parents
+            )
+            lines.append(_CHANGE_IMPACT_ACTION_REQUIRED)
     else:
-        lines.append("## ✅ All Requirements Up-to-Date")
-        lines.append("")
-        lines.append("No requirements found with stale parent references. All tracked parent versions match current versions.")
-        lines.append("")
+        lines.append(_CHANGE_IMPACT_UP_TO_DATE)
 
     return "\n".join(lines)
 
 
 def generate_compliance_report(requirements_data, standard_name, critical_type=None):
     """Generate compliance report in markdown."""
-    lines = []
-    lines.append(f"# Compliance Report: {standard_name}")
-    lines.append("")
-    lines.append(f"This report summarizes compliance status for requirements referencing {standard_name}.")
-    lines.append("Note: 'Linked Tests' refers to test references in frontmatter, not verified test execution.")
-    lines.append("")
-
-    # Categorize requirements by type
+    lines = [
+        f"# Compliance Report: {standard_name}",
+        "",
+        f"This report summarizes compliance status for requirements referencing {standard_name}.",
+        "Note: 'Linked Tests' refers to test references in frontmatter, not verified test execution.",
+        "",
+    ]
+
+    # Categorize requirements by type. Whether a requirement has linked tests
+    # and references the standard is decided once here and reused by the
+    # detail table and the gap lists below.
     type_counts = {}
     reqs_by_type = {}
-    reqs_with_standard = []
-    reqs_with_tests = []
+    reqs_with_standard = 0
+    reqs_with_tests = 0
 
-    for req_id, frontmatter in requirements_data:
+    # Standards match case-insensitively by substring
+    standard_needle = standard_name.lower()
+
+    for req_id, title, frontmatter, refs in index_references(requirements_data):
         req_type = frontmatter.get("type", "unspecified")
 
+        # Check standard reference
+        has_standard = any(standard_needle in std.lower() for std in refs["standards"])
+
+        # Check linked tests
+        has_tests = bool(refs["tests"])
+
+        reqs_with_standard += has_standard
+        reqs_with_tests += has_tests
+
         # Count by type
         type_counts[req_type] = type_counts.get(req_type, 0) + 1
         if req_type not in reqs_by_type:
             reqs_by_type[req_type] = []
-        reqs_by_type[req_type].append((req_id, frontmatter))
-
-        # Check standard reference
-        if "references" in frontmatter and isinstance(frontmatter["references"], dict):
-            if "standards" in frontmatter["references"]:
-                standards = frontmatter["references"]["standards"]
-                for std in standards:
-                    if standard_name.lower() in std.lower():
-                        reqs_with_standard.append((req_id, frontmatter))
-                        break
-
-        # Check linked tests
-        if "references" in frontmatter and isinstance(frontmatter["references"], dict):
-            if "tests" in frontmatter["references"] and frontmatter["references"]["tests"]:
-                reqs_with_tests.append((req_id, frontmatter))
+        reqs_by_type[req_type].append((req_id, title, frontmatter, has_tests, has_standard))
 
     total_reqs = len(requirements_data)
 
     # Summary
-    lines.append("## Summary")
-    lines.append("")
-    lines.append("| Metric | Count | Percentage |")
-    lines.append("|--------|-------|------------|")
-    lines.append(f"| Total Requirements | {total_reqs} | 100% |")
+    lines.extend([
+        "## Summary",
+        "",
+        "| Metric | Count | Percentage |",
+        "|--------|-------|------------|",
+        f"| Total Requirements | {total_reqs} | 100% |",
+    ])
 
     # Show breakdown by type
     for req_type in sorted(type_counts.keys()):
         count = type_counts[req_type]
-        percentage = (count * 100) // total_reqs if total_reqs > 0 else 0
         type_label = req_type.capitalize() if req_type != "unspecified" else "Unspecified Type"
         marker = " ⚠️" if critical_type and req_type == critical_type else ""
-        lines.append(f"| {type_label} Requirements{marker} | {count} | {percentage}% |")
+        lines.append(f"| {type_label} Requirements{marker} | {count} | {percentage(count, total_reqs)}% |")
 
-    lines.append(f"| Requirements Referencing {standard_name} | {len(reqs_with_standard)} | {(len(reqs_with_standard) * 100) // total_reqs if total_reqs > 0 else 0}% |")
-    lines.append(f"| Requirements with Linked Tests | {len(reqs_with_tests)} | {(len(reqs_with_tests) * 100) // total_reqs if total_reqs > 0 else 0}% |")
-    lines.append("")
+    lines.extend([
+        f"| Requirements Referencing {standard_name} | {reqs_with_standard} | {percentage(reqs_with_standard, total_reqs)}% |",
+        f"| Requirements with Linked Tests | {reqs_with_tests} | {percentage(reqs_with_tests, total_reqs)}% |",
+        "",
+    ])
 
     # Requirements by status
     status_counts = {}
@@ -462,10 +550,7 @@ def generate_compliance_report(requirements_data, standard_name, critical_type=N
         status = frontmatter.get("status", "unknown")
         status_counts[status] = status_counts.get(status, 0) + 1
 
-    lines.append("## Requirements by Status")
-    lines.append("")
-    lines.append("| Status | Count |")
-    lines.append("|--------|-------|")
+    lines.append(_COMPLIANCE_STATUS_HEADER)
     for status in ["draft", "proposed", "approved", "implemented", "verified", "deprecated"]:
         count = status_counts.get(status, 0)
         if count > 0:
@@ -479,85 +564,52 @@ def generate_compliance_report(requirements_data, standard_name, critical_type=N
     # Critical type requirements detail (if specified)
     if critical_type and critical_type in reqs_by_type:
         critical_reqs = reqs_by_type[critical_type]
-        lines.append(f"## {critical_type.capitalize()} Requirements Detail")
-        lines.append("")
-        lines.append("| Requirement | Title | Status | Linked Tests | Standard Reference |")
-        lines.append("|-------------|-------|--------|--------------|-------------------|")
-
-        for req_id, frontmatter in critical_reqs:
-            title = frontmatter.get("title", "")
+        lines.extend([
+            f"## {critical_type.capitalize()} Requirements Detail",
+            "",
+            "| Requirement | Title | Status | Linked Tests | Standard Reference |",
+            "|-------------|-------|--------|--------------|-------------------|",
+        ])
+
+        for req_id, title, frontmatter, has_tests, has_standard in critical_reqs:
             status = frontmatter.get("status", "-")
-
-            has_tests = "✅"
-            if "references" in frontmatter and isinstance(frontmatter["references"], dict):
-                if "tests" in frontmatter["references"] and frontmatter["references"]["tests"]:
-                    has_tests = "✅"
-                else:
-                    has_tests = "❌"
-            else:
-                has_tests = "❌"
-
-            has_standard = "❌"
-            if "references" in frontmatter and isinstance(frontmatter["references"], dict):
-                if "standards" in frontmatter["references"]:
-                    standards = frontmatter["references"]["standards"]
-                    for std in standards:
-                        if standard_name.lower() in std.lower():
-                            has_standard = "✅"
-                            break
-
-            lines.append(f"| {req_id} | {title} | {status} | {has_tests} | {has_standard} |")
+            tests_mark = "✅" if has_tests else "❌"
+            standard_mark = "✅" if has_standard else "❌"
+            lines.append(f"| {req_id} | {title} | {status} | {tests_mark} | {standard_mark} |")
         lines.append("")
 
     # Compliance gaps
-    lines.append("## Compliance Gaps")
-    lines.append("")
+    lines.extend(["## Compliance Gaps", ""])
 
     # Critical type requirements without linked tests (if critical_type specified)
     if critical_type and critical_type in reqs_by_type:
         critical_reqs = reqs_by_type[critical_type]
-        critical_without_tests = []
-        for req_id, frontmatter in critical_reqs:
-            has_tests = False
-            if "references" in frontmatter and isinstance(frontmatter["references"], dict):
-                if "tests" in frontmatter["references"] and frontmatter["references"]["tests"]:
-                    has_tests = True
-            if not has_tests:
-                critical_without_tests.append((req_id, frontmatter.get("title", "")))
+        critical_without_tests = [
+            (req_id, title)
+            for req_id, title, _, has_tests, _ in critical_reqs
+            if not has_tests
+        ]
 
         if critical_without_tests:
-            lines.append(f"### ⚠️ {critical_type.capitalize()} Requirements without Linked Tests")
-            lines.append("")
-            for req_id, title in critical_without_tests:
-                lines.append(f"- **{req_id}**: {title}")
+            lines.extend([f"### ⚠️ {critical_type.capitalize()} Requirements without Linked Tests", ""])
+            lines.extend(f"- **{req_id}**: {title}" for req_id, title in critical_without_tests)
             lines.append("")
         else:
-            lines.append(f"### ✅ All {critical_type.capitalize()} Requirements have Linked Tests")
-            lines.append("")
+            lines.extend([f"### ✅ All {critical_type.capitalize()} Requirements have Linked Tests", ""])
 
         # Critical type requirements without standard reference
-        critical_without_standard = []
-        for req_id, frontmatter in critical_reqs:
-            has_standard = False
-            if "references" in frontmatter and isinstance(frontmatter["references"], dict):
-                if "standards" in frontmatter["references"]:
-                    standards = frontmatter["references"]["standards"]
-                    for std in standards:
-                        if standard_name.lower() in std.lower():
-                            has_standard = True
-                            break
-            if not has_standard:
-                critical_without_standard.append((req_id, frontmatter.get("title", "")))
+        critical_without_standard = [
+            (req_id, title)
+            for req_id, title, _, _, has_standard in critical_reqs
+            if not has_standard
+        ]
 
         if critical_without_standard:
-            lines.append(f"### ⚠️ {critical_type.capitalize()} Requirements without {standard_name} Reference")
-            lines.append("")
-            for req_id, title in critical_without_standard:
-                lines.append(f"- **{req_id}**: {title}")
+            lines.extend([f"### ⚠️ {critical_type.capitalize()} Requirements without {standard_name} Reference", ""])
+            lines.extend(f"- **{req_id}**: {title}" for req_id, title in critical_without_standard)
             lines.append("")
         else:
-            lines.append(f"### ✅ All {critical_type.capitalize()} Requirements reference {standard_name}")
-            lines.append("")
+            lines.extend([f"### ✅ All {critical_type.capitalize()} Requirements reference {standard_name}", ""])
 
     # General gaps (all requirements)
     unverified = []
@@ -567,60 +619,54 @@ def generate_compliance_report(requirements_data, standard_name, critical_type=N
             unverified.append((req_id, frontmatter.get("title", ""), status, frontmatter.get("type", "unspecified")))
 
     if unverified:
-        lines.append("### Requirements Not Yet Verified")
-        lines.append("")
-        lines.append("| Requirement | Title | Type | Current Status |")
-        lines.append("|-------------|-------|------|----------------|")
-        for req_id, title, status, req_type in unverified:
-            lines.append(f"| {req_id} | {title} | {req_type} | {status} |")
+        lines.append(_COMPLIANCE_NOT_VERIFIED_HEADER)
+        lines.extend(
+            f"| {req_id} | {title} | {req_type} | {status} |"
+            for req_id, title, status, req_type in unverified
+        )
         lines.append("")
 
     return "\n".join(lines)
 
 
+# Report type to generator; each takes the parsed requirements and CLI args
+REPORT_GENERATORS = {
+    "traceability": lambda requirements_data, args: generate_traceability_matrix(requirements_data),
+    "coverage": lambda requirements_data, args: generate_coverage_report(requirements_data),
+    "change_impact": lambda requirements_data, args: generate_change_impact(requirements_data),
+    "compliance": lambda requirements_data, args: generate_compliance_report(
+        requirements_data, args.standard, args.critical_type
+    ),
+}
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Generate requirement reports from markdown files.")
+    parser.add_argument("report_type", choices=REPORT_GENERATORS, help="Type of report to generate")
+    parser.add_argument("output_file", help="Path of the markdown report to write")
+    parser.add_argument("input_files", nargs="+", help="Requirement markdown files")
+    parser.add_argument("--standard", default="ISO 26262", help="Standard for compliance reports")
+    parser.add_argument("--critical-type", default=None, help="Requirement type to highlight in compliance reports")
+    return parser.parse_intermixed_args(argv)
+
+
 def main():
-    if len(sys.argv) < 4:
-        print("Usage: generate_report.py <report_type> <output_file> <input_files...> [--standard=NAME] [--critical-type=TYPE]")
-        sys.exit(1)
-
-    report_type = sys.argv[1]
-    output_file = sys.argv[2]
-    input_files = []
-    standard = "ISO 26262"
-    critical_type = None
-
-    for arg in sys.argv[3:]:
-        if arg.startswith("--standard="):
-            standard = arg.split("=", 1)[1]
-        elif arg.startswith("--critical-type="):
-            critical_type = arg.split("=", 1)[1]
-        else:
-            input_files.append(arg)
+    # Arguments, including the report type, are validated before any file is read
+    args = parse_args()
 
     # Parse all requirement files
     requirements_data = []
-    for file_path in input_files:
+    for file_path in args.input_files:
         parsed = parse_requirement_file(file_path)
         if parsed:
             requirements_data.append(parsed)
 
     # Generate report
-    if report_type == "traceability":
-        report = generate_traceability_matrix(requirements_data)
-    elif report_type == "coverage":
-        report = generate_coverage_report(requirements_data)
-    elif report_type == "change_impact":
-        report = generate_change_impact(requirements_data)
-    elif report_type == "compliance":
-        report = generate_compliance_report(requirements_data, standard, critical_type)
-    else:
-        print(f"Unknown report type: {report_type}")
-        sys.exit(1)
+    report = REPORT_GENERATORS[args.report_type](requirements_data, args)
 
-    # Write output
-    with open(output_file, 'w') as f:
-        f.write(report)
-        f.write("\n")
+    # Write output in a single call
+    Path(args.output_file).write_text(report + "\n", encoding="utf-8")
 
 
 if __name__ == "__main__":
@@ -129,14 +129,11 @@ def parameter_library(
         "source_label": source_label,
     }
 
-    # Validate at load time
-    validation_error = validator.validate(param_data)
+    # Validate at load time while generating the C++ header
+    cpp_code, validation_error = cpp_generator.generate_validated(param_data)
     if validation_error:
         fail("Parameter validation failed for {}: {}".format(name, validation_error))
 
-    # Generate C++ header
-    cpp_code = cpp_generator.generate(param_data)
-
     # Create a generated header file
     native.genrule(
         name = name,
@@ -28,25 +28,26 @@ def _generate_python_value(param):
     return None
 
 def _generate_table_class(param, class_name):
-    """Generate Python dataclass for table parameter.
+    """Generate Python NamedTuple for table parameter.
 
     Args:
         param: Table parameter dictionary
-        class_name: Name for the dataclass
+        class_name: Name for the row class
 
     Returns:
-        List of lines for the dataclass definition
+        List of lines for the row class and table data
     """
     lines = []
     columns = param.get("columns", [])
     rows = param.get("rows", [])
 
-    # Generate dataclass
-    lines.append("@dataclasses.dataclass(frozen=True)")
-    lines.append("class {}:".format(class_name))
+    # Generate row class. NamedTuple rows are immutable tuples without a
+    # per-row __dict__, and field access is C-level tuple indexing.
+    lines.append("class {}(typing.NamedTuple):".format(class_name))
     lines.append("    \"\"\"{}\"\"\"".format(param.get("description", "")))
 
     # Generate fields
+    py_types = []
     for col in columns:
         col_name = col["name"]
         col_type = col["type"]
@@ -63,6 +64,7 @@ def _generate_table_class(param, class_name):
             py_type = "bool"
         else:
             py_type = "Any"
+        py_types.append(py_type)
 
         unit_comment = "  # Unit: {}".format(unit) if unit else ""
         lines.append("    {}: {}{}".format(col_name, py_type, unit_comment))
@@ -71,8 +73,10 @@ def _generate_table_class(param, class_name):
 
     # Generate data list
     lines.append("")
-    lines.append("{}_DATA: typing.List[{}] = [".format(param["name"].upper(), class_name))
+    table_name = param["name"].upper()
+    lines.append("{}_DATA: typing.Tuple[{}, ...] = (".format(table_name, class_name))
 
+    formatted_rows = []
     for row in rows:
         values = []
         for i, col in enumerate(columns):
@@ -87,9 +91,23 @@ def _generate_table_class(param, class_name):
             else:
                 values.append(str(val))
 
+        formatted_rows.append(values)
         lines.append("    {}({}),".format(class_name, ", ".join(values)))
 
-    lines.append("]")
+    lines.append(")")
+    lines.append("")
+
+    # Generate one tuple per column so a single column can be scanned
+    # (e.g. bisected) without walking every row
+    for col_idx, col in enumerate(columns):
+        col_values = [values[col_idx] for values in formatted_rows]
+        col_values_str = ", ".join(col_values) + ("," if len(col_values) == 1 else "")
+        lines.append("{}_{}_VALUES: typing.Tuple[{}, ...] = ({})".format(
+            table_name,
+            col["name"].upper(),
+            py_types[col_idx],
+            col_values_str,
+        ))
     lines.append("")
 
     return lines
@@ -106,6 +124,70 @@ def _to_pascal_case(snake_str):
     components = snake_str.split("_")
     return "".join([c.capitalize() for c in components])
 
+def find_invalid_field_name(parameters):
+    """Find a table column that cannot be a field of the generated row class.
+
+    Rows are typing.NamedTuple classes, which reject field names starting
+    with an underscore when the generated module is imported.
+
+    Args:
+        parameters: List of parameter dictionaries
+
+    Returns:
+        Error message string for the first such column, None otherwise
+    """
+    for param in parameters:
+        if param["type"] != "table":
+            continue
+        for col in param.get("columns", []):
+            if col["name"].startswith("_"):
+                return "table '{}' column '{}' cannot start with an underscore in generated Python rows".format(
+                    param["name"],
+                    col["name"],
+                )
+
+    return None
+
+def find_name_collision(parameters):
+    """Find a module-level Python name generated for two different sources.
+
+    Table column tuples are named {TABLE}_{COLUMN}_VALUES, so e.g. table "a"
+    with column "b_c" and table "a_b" with column "c" would both define
+    A_B_C_VALUES.
+
+    Args:
+        parameters: List of parameter dictionaries
+
+    Returns:
+        Error message string if a name is generated twice, None otherwise
+    """
+    sources = {}
+    for param in parameters:
+        if param["type"] == "table":
+            table_name = param["name"].upper()
+            names = [
+                (_to_pascal_case(param["name"]) + "Row", "table '{}'".format(param["name"])),
+                (table_name + "_DATA", "table '{}'".format(param["name"])),
+            ]
+            for col in param.get("columns", []):
+                names.append((
+                    "{}_{}_VALUES".format(table_name, col["name"].upper()),
+                    "table '{}' column '{}'".format(param["name"], col["name"]),
+                ))
+        else:
+            names = [(param["name"].upper(), "parameter '{}'".format(param["name"]))]
+
+        for name, source in names:
+            if name in sources:
+                return "Python name '{}' is generated for both {} and {}".format(
+                    name,
+                    sources[name],
+                    source,
+                )
+            sources[name] = source
+
+    return None
+
 def generate_python_code(_namespace, parameters, source_label = None):
     """Generate Python module with parameters.
 
@@ -117,6 +199,14 @@ def generate_python_code(_namespace, parameters, source_label = None):
     Returns:
         Python module content as string
     """
+    invalid_field = find_invalid_field_name(parameters)
+    if invalid_field:
+        fail(invalid_field)
+
+    collision = find_name_collision(parameters)
+    if collision:
+        fail(collision)
+
     lines = []
 
     # Header
@@ -125,7 +215,6 @@ def generate_python_code(_namespace, parameters, source_label = None):
     if source_label:
         lines.append("# Generated from: {}".format(source_label))
     lines.append("")
-    lines.append("import dataclasses")
     lines.append("import typing")
     lines.append("from typing import Any, List")
     lines.append("")
@@ -182,4 +271,6 @@ def _get_python_type(param_type):
 # Export generator
 python_generator = struct(
     generate = generate_python_code,
+    find_invalid_field_name = find_invalid_field_name,
+    find_name_collision = find_name_collision,
 )
@@ -0,0 +1,110 @@
+"""Unit tests for Python code generator."""
+
+load("@bazel_skylib//lib:unittest.bzl", "asserts", "unittest")
+load(":python_generator.bzl", "python_generator")
+
+def _test_table_column_values(ctx):
+    """Test Python generation of per-column value tuples for a table."""
+    env = unittest.begin(ctx)
+
+    result = python_generator.generate(
+        "test",
+        [
+            {
+                "columns": [
+                    {"name": "speed", "type": "float", "unit": "m/s"},
+                    {"name": "label", "type": "string"},
+                ],
+                "description": "Speed limits",
+                "name": "speed_limits",
+                "rows": [
+                    [10.0, "slow"],
+                    [20.0, "fast"],
+                ],
+                "type": "table",
+            },
+        ],
+    )
+
+    asserts.true(env, "SPEED_LIMITS_SPEED_VALUES: typing.Tuple[float, ...] = (10.0, 20.0)" in result, "Should have float column tuple")
+    asserts.true(env, "SPEED_LIMITS_LABEL_VALUES: typing.Tuple[str, ...] = (\"slow\", \"fast\")" in result, "Should have string column tuple")
+
+    return unittest.end(env)
+
+def _test_invalid_field_name(ctx):
+    """Test detection of table columns that cannot be NamedTuple fields."""
+    env = unittest.begin(ctx)
+
+    test_cases = [
+        # Leading underscore is rejected by typing.NamedTuple
+        (
+            [
+                {"name": "gain", "type": "float", "value": 1.0},
+                {"columns": [{"name": "speed", "type": "float"}, {"name": "_raw", "type": "integer"}], "name": "samples", "rows": [[1.0, 2]], "type": "table"},
+            ],
+            "table 'samples' column '_raw' cannot start with an underscore in generated Python rows",
+        ),
+        # Underscores elsewhere in the name are fine
+        (
+            [
+                {"columns": [{"name": "raw_", "type": "integer"}, {"name": "raw_value", "type": "integer"}], "name": "samples", "rows": [[1, 2]], "type": "table"},
+            ],
+            None,
+        ),
+    ]
+
+    for parameters, expected in test_cases:
+        asserts.equals(env, expected, python_generator.find_invalid_field_name(parameters))
+
+    return unittest.end(env)
+
+def _test_name_collision(ctx):
+    """Test detection of Python names generated for two different sources."""
+    env = unittest.begin(ctx)
+
+    test_cases = [
+        # Column tuple names collide across tables
+        (
+            [
+                {"columns": [{"name": "b_c", "type": "integer"}], "name": "a", "rows": [[1]], "type": "table"},
+                {"columns": [{"name": "c", "type": "integer"}], "name": "a_b", "rows": [[2]], "type": "table"},
+            ],
+            "Python name 'A_B_C_VALUES' is generated for both table 'a' column 'b_c' and table 'a_b' column 'c'",
+        ),
+        # Column tuple name collides with a simple parameter
+        (
+            [
+                {"columns": [{"name": "b", "type": "integer"}], "name": "a", "rows": [[1]], "type": "table"},
+                {"name": "a_b_values", "type": "integer", "value": 3},
+            ],
+            "Python name 'A_B_VALUES' is generated for both table 'a' column 'b' and parameter 'a_b_values'",
+        ),
+        # Distinct names
+        (
+            [
+                {"columns": [{"name": "b", "type": "integer"}], "name": "a", "rows": [[1]], "type": "table"},
+                {"columns": [{"name": "c", "type": "integer"}], "name": "a_b", "rows": [[2]], "type": "table"},
+                {"name": "a_c_values", "type": "integer", "value": 3},
+            ],
+            None,
+        ),
+    ]
+
+    for parameters, expected in test_cases:
+        asserts.equals(env, expected, python_generator.find_name_collision(parameters))
+
+    return unittest.end(env)
+
+# Test suite
+table_column_values_test = unittest.make(_test_table_column_values)
+invalid_field_name_test = unittest.make(_test_invalid_field_name)
+name_collision_test = unittest.make(_test_name_collision)
+
+def python_generator_test_suite(name):
+    """Create test suite for python_generator."""
+    unittest.suite(
+        name,
+        table_column_values_test,
+        invalid_field_name_test,
+        name_collision_test,
+    )
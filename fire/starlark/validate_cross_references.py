@@ -17,10 +17,27 @@ WHY PYTHON?: Starlark rules cannot directly read arbitrary files during build.
 Python handles file I/O and applies the same validation rules defined in Starlark.
 """
 
+import functools
 import os
 import re
 import sys
 
+# version=N parameter in a requirement link's query string
+_VERSION_RE = re.compile(r'(?:^|&)version=(\d+)(?=&|\Z)')
+
+# Markdown body references, found in a single scan of the body:
+#   [@param](path#param)
+#   [REQ-ID](path.md?version=N#anchor) or [REQ-ID](path.md)
+#   [test_name](//package:target)
+# Each kind is an optional lookahead after the opening '[', so one link can
+# match several kinds exactly as it would with a separate pattern per kind.
+_REFERENCE_RE = re.compile(
+    r'\[(?=@?[a-zA-Z_][a-zA-Z0-9_-]*\]\()'
+    r'(?:(?=@(?P<param_name>[a-zA-Z_][a-zA-Z0-9_]*)\]\((?P<param_path>[^)]+)\)))?'
+    r'(?:(?=(?P<req_id>[A-Z][A-Z0-9_-]+)\]\((?P<req_url>[^)]+\.md[^)]*)\)))?'
+    r'(?:(?=(?P<test_name>[a-zA-Z_][a-zA-Z0-9_]*)\]\((?P<test_label>//[^)]+:[^)]+)\)))?'
+)
+
 
 def parse_inline_yaml_for_requirement(content, req_id):
     """Parse inline YAML block for a specific requirement ID.
@@ -28,30 +45,41 @@ def parse_inline_yaml_for_requirement(content, req_id):
     Looks for ## REQ-ID heading followed by ```yaml block.
     Returns the parsed YAML as a dict with 'id' and other fields.
     """
-    lines = content.split('\n')
-    in_req_section = False
+    heading = f'## {req_id}'
+
+    # Find the first line starting with the heading, without splitting the
+    # whole document into lines
+    if content.startswith(heading):
+        section_start = 0
+    else:
+        section_start = content.find('\n' + heading)
+        if section_start == -1:
+            return None
+        section_start += 1
+
+    # The section ends at the next heading for a different requirement
+    section_end = content.find('\n## ', section_start)
+    while section_end != -1 and content.startswith(heading, section_end + 1):
+        section_end = content.find('\n## ', section_end + 1)
+    if section_end == -1:
+        section_end = len(content)
+
     in_yaml_block = False
     yaml_lines = []
 
-    for i, line in enumerate(lines):
-        if line.startswith(f'## {req_id}'):
-            in_req_section = True
+    for line in content[section_start:section_end].split('\n')[1:]:
+        if line.startswith(heading):
             continue
 
-        if in_req_section:
-            if line.startswith('## ') and not line.startswith(f'## {req_id}'):
-                # Hit next section, stop
-                break
-
-            if line.strip() == '```yaml':
-                in_yaml_block = True
-                continue
+        if line.strip() == '```yaml':
+            in_yaml_block = True
+            continue
 
-            if in_yaml_block:
-                if line.strip() == '```':
-                    # End of YAML block
-                    break
-                yaml_lines.append(line)
+        if in_yaml_block:
+            if line.strip() == '```':
+                # End of YAML block
+                break
+            yaml_lines.append(line)
 
     if not yaml_lines:
         return None
@@ -80,25 +108,50 @@ def parse_inline_yaml_for_requirement(content, req_id):
 
     return frontmatter
 
+def _find_delimiter_line(content, start):
+    """Find the next line at or after start that is '---' once stripped.
+
+    Returns (line_start, line_end) offsets into content, where line_end is the
+    position of the terminating newline (or the end of content), or None.
+    """
+    pos = content.find("---", start)
+    while pos != -1:
+        line_start = content.rfind("\n", 0, pos) + 1
+        line_end = content.find("\n", pos)
+        if line_end == -1:
+            line_end = len(content)
+        if content[line_start:line_end].strip() == "---":
+            return line_start, line_end
+        pos = content.find("---", line_end)
+    return None
+
+
 def parse_frontmatter(content):
     """Parse YAML frontmatter from markdown content."""
     if not content.startswith("---"):
         return None, content
 
-    lines = content.split("\n")
-    if len(lines) < 3:
+    # Find closing --- in place; only the frontmatter is split into lines
+    fm_start = content.find("\n") + 1
+    if not fm_start:
         return None, content
 
-    # Find closing ---
-    end_idx = -1
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            end_idx = i
-            break
+    closing = _find_delimiter_line(content, fm_start)
+    if closing is None:
+        return None, content
 
-    if end_idx == -1:
+    fm_end, closing_end = closing
+    if closing_end == len(content) and fm_end == fm_start:
+        # Two-line file; not treated as frontmatter
         return None, content
 
+    # Strip each frontmatter line and measure its indentation once; the
+    # parser below also looks one line ahead
+    fm_lines = []
+    for line in content[fm_start:fm_end].split("\n")[:-1]:
+        lstripped = line.lstrip()
+        fm_lines.append((lstripped.rstrip(), len(line) - len(lstripped)))
+
     # Simple YAML parsing for references section
     frontmatter = {}
     current_key = None
@@ -106,27 +159,26 @@ def parse_frontmatter(content):
     current_dict_item = None
     base_indent = 0
 
-    for i in range(1, end_idx):
-        line = lines[i]
-        stripped = line.strip()
-
+    for i, (stripped, indent) in enumerate(fm_lines):
         if not stripped or stripped.startswith("#"):
             continue
 
-        # Calculate indentation
-        indent = len(line) - len(line.lstrip())
-
         # List item
         if stripped.startswith("-"):
             rest = stripped[1:].strip()
 
+            # List under the current nested key that items are appended to
+            items = None
+            if current_key and current_list:
+                section = frontmatter[current_key]
+                if isinstance(section, dict):
+                    items = section.setdefault(current_list, [])
+
             # Check if next line (if exists) is indented more - indicates a multi-line dict item
             is_multiline_dict = False
-            if i + 1 < end_idx:
-                next_line = lines[i + 1]
-                next_stripped = next_line.strip()
+            if i + 1 < len(fm_lines):
+                next_stripped, next_indent = fm_lines[i + 1]
                 if next_stripped and not next_stripped.startswith("-"):
-                    next_indent = len(next_line) - len(next_line.lstrip())
                     if next_indent > indent and ":" in next_stripped:
                         is_multiline_dict = True
 
@@ -134,47 +186,37 @@ def parse_frontmatter(content):
             # Dict items have format "- key: value" where key is a dict-like key (path, version, etc.)
             # NOT Bazel labels (//...:...) or ISO standards (ISO ...:...)
             is_dict_item = False
-            if ":" in rest and not rest.startswith("//") and not rest.startswith("ISO "):
+            if ":" in rest and not rest.startswith(("//", "ISO ")):
                 # Check if this looks like a dict key (starts with alphanumeric word followed by colon)
-                parts = rest.split(":", 1)
-                potential_key = parts[0].strip()
+                dict_key, dict_value = rest.split(":", 1)
+                dict_key = dict_key.strip()
                 # Common dict keys we expect: path, version, description, etc.
-                if potential_key.replace("_", "").replace("-", "").isalnum():
+                if dict_key.replace("_", "").replace("-", "").isalnum():
                     is_dict_item = True
 
             if is_dict_item:
-                parts = rest.split(":", 1)
-                dict_key = parts[0].strip()
-                dict_value = parts[1].strip() if len(parts) > 1 else ""
+                dict_value = dict_value.strip()
 
                 # Start a new dict item (or continue multi-line dict)
                 if is_multiline_dict:
                     current_dict_item = {dict_key: dict_value}
-                    if current_key and current_list and isinstance(frontmatter[current_key], dict):
-                        if current_list not in frontmatter[current_key]:
-                            frontmatter[current_key][current_list] = []
-                        frontmatter[current_key][current_list].append(current_dict_item)
+                    if items is not None:
+                        items.append(current_dict_item)
                 else:
                     # Single-line dict item
-                    single_dict = {dict_key: dict_value}
-                    if current_key and current_list and isinstance(frontmatter[current_key], dict):
-                        if current_list not in frontmatter[current_key]:
-                            frontmatter[current_key][current_list] = []
-                        frontmatter[current_key][current_list].append(single_dict)
+                    if items is not None:
+                        items.append({dict_key: dict_value})
                     current_dict_item = None  # Don't expect continuation
-            else:
+            elif items is not None:
                 # Simple string item (even if it contains ':')
-                if current_key and current_list and isinstance(frontmatter[current_key], dict):
-                    if current_list not in frontmatter[current_key]:
-                        frontmatter[current_key][current_list] = []
-                    frontmatter[current_key][current_list].append(rest)
-                    current_dict_item = None
+                items.append(rest)
+                current_dict_item = None
 
         # Key-value pair
         elif ":" in stripped:
-            parts = stripped.split(":", 1)
-            key = parts[0].strip()
-            value = parts[1].strip() if len(parts) > 1 else ""
+            key, value = stripped.split(":", 1)
+            key = key.strip()
+            value = value.strip()
 
             if indent == 0 or indent == base_indent:
                 # Top-level key (or back to base level)
@@ -192,63 +234,170 @@ def parse_frontmatter(content):
             elif current_key and indent > base_indent:
                 # Nested key under current_key
                 current_dict_item = None  # Exit dict mode when we see a new nested key
-                if value:
-                    if isinstance(frontmatter[current_key], dict):
-                        frontmatter[current_key][key] = value
-                else:
-                    if isinstance(frontmatter[current_key], dict):
-                        frontmatter[current_key][key] = []
+                section = frontmatter[current_key]
+                if isinstance(section, dict):
+                    if value:
+                        section[key] = value
+                    else:
+                        section[key] = []
                         current_list = key
 
-    body = "\n".join(lines[end_idx + 1:])
+    body = content[closing_end + 1:]
     return frontmatter, body
 
 
+@functools.lru_cache(maxsize=None)
+def _load(path):
+    """Read and parse a requirement file once per process.
+
+    Returns (content, frontmatter, body). Files are loaded both when they are
+    validated and whenever another requirement links to them, so the result
+    is cached by normalized path.
+    """
+    content = _read_text(path)
+    frontmatter, body = parse_frontmatter(content)
+    return content, frontmatter, body
+
+
+@functools.lru_cache(maxsize=None)
+def _find_requirement(path, req_id):
+    """Return the metadata a requirement file declares for req_id, or None.
+
+    Cached so a requirement linked from many files is resolved once, which
+    matters most for inline YAML blocks in multi-requirement files.
+    """
+    # Try frontmatter first (for traditional frontmatter style)
+    content, frontmatter, _ = _load(path)
+
+    # If no frontmatter, try parsing inline YAML block (for ## REQ-ID style)
+    if not frontmatter or frontmatter.get('id') != req_id:
+        frontmatter = parse_inline_yaml_for_requirement(content, req_id)
+
+    if not frontmatter or frontmatter.get('id') != req_id:
+        return None
+    return frontmatter
+
+
+def _read_text(path):
+    """Read a file as UTF-8 text with universal newlines.
+
+    The file is read as bytes and decoded in one call, bypassing the
+    incremental text I/O layer and any locale-dependent default encoding.
+    """
+    with open(path, 'rb') as f:
+        content = f.read().decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+@functools.lru_cache(maxsize=None)
+def _read_file(path):
+    """Read a referenced parameter or BUILD file once per process."""
+    return _read_text(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _quoted_names(path, prefix):
+    """Index every name written as prefix"name" or prefix'name' in a file.
+
+    Splitting on a quote character yields every run of text between two
+    consecutive quotes, so one pass per file finds all candidate names.
+    Names containing a quote character are never included.
+    """
+    content = _read_file(path)
+    names = set()
+    for quote in ('"', "'"):
+        pieces = content.split(quote)
+        names.update(name for before, name in zip(pieces, pieces[1:-1]) if before.endswith(prefix))
+    return frozenset(names)
+
+
+def _contains_quoted(path, prefix, name):
+    """Check whether a file contains prefix"name" or prefix'name'."""
+    if '"' in name or "'" in name:
+        content = _read_file(path)
+        return f'{prefix}"{name}"' in content or f"{prefix}'{name}'" in content
+    return name in _quoted_names(path, prefix)
+
+
+def _defines_parameter(path, param_name):
+    """Check whether a parameter file defines a parameter.
+
+    Simple check for the quoted parameter name; in Starlark, parameters are
+    defined like: "param_name": {...}
+    """
+    return _contains_quoted(path, "", param_name)
+
+
+def _defines_target(build_file, target_name):
+    """Check whether a BUILD file declares a target.
+
+    Simple check: the target name should appear in the BUILD file. This is
+    not perfect but avoids recursive Bazel invocation.
+    """
+    return _contains_quoted(build_file, "name = ", target_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _find_build_file(workspace_root, package_path):
+    """Return the BUILD.bazel or BUILD file of a package, or None if it has neither."""
+    for build_name in ['BUILD.bazel', 'BUILD']:
+        potential_path = os.path.join(workspace_root, package_path, build_name)
+        try:
+            _read_file(potential_path)
+        except FileNotFoundError:
+            continue
+        return potential_path
+    return None
+
+
+def _split_requirement_url(full_url):
+    """Split a requirement link URL into its path (with fragment) and version."""
+    if '?' not in full_url:
+        return full_url, None
+
+    # Extract version from query parameter
+    version = None
+    path_part, query_part = full_url.split('?', 1)
+    # Extract query string (before # if present)
+    query_str = query_part.split('#')[0] if '#' in query_part else query_part
+    # Parse version=N; the last one wins
+    for match in _VERSION_RE.finditer(query_str):
+        version = int(match.group(1))
+    # Reconstruct clean path with fragment if present
+    clean_path = path_part
+    if '#' in query_part:
+        clean_path = clean_path + '#' + query_part.split('#')[1]
+
+    return clean_path, version
+
+
 def extract_markdown_references(body):
     """Extract parameter, requirement, and test references from markdown body."""
     param_refs = []
     req_refs = []
     test_refs = []
 
-    # Pattern for [@param](path#param)
-    param_pattern = r'\[@([a-zA-Z_][a-zA-Z0-9_]*)\]\(([^)]+)\)'
-    for match in re.finditer(param_pattern, body):
-        param_name = match.group(1)
-        param_path = match.group(2)
-        param_refs.append((param_name, param_path))
-
-    # Pattern for [REQ-ID](path.md?version=N#anchor) or [REQ-ID](path.md)
-    req_pattern = r'\[([A-Z][A-Z0-9_-]+)\]\(([^)]+\.md[^)]*)\)'
-    for match in re.finditer(req_pattern, body):
-        req_id = match.group(1)
-        full_url = match.group(2)
-
-        # Extract version from query parameter if present
-        version = None
-        clean_path = full_url
-        if '?' in full_url:
-            path_part, query_part = full_url.split('?', 1)
-            # Extract query string (before # if present)
-            query_str = query_part.split('#')[0] if '#' in query_part else query_part
-            # Parse version=N
-            for param in query_str.split('&'):
-                if '=' in param:
-                    key, value = param.split('=', 1)
-                    if key == 'version' and value.isdigit():
-                        version = int(value)
-            # Reconstruct clean path with fragment if present
-            clean_path = path_part
-            if '#' in query_part:
-                clean_path = clean_path + '#' + query_part.split('#')[1]
-
-        req_refs.append((req_id, clean_path, version))
-
-    # Pattern for [test_name](//package:target)
-    test_pattern = r'\[([a-zA-Z_][a-zA-Z0-9_]*)\]\((//[^)]+:[^)]+)\)'
-    for match in re.finditer(test_pattern, body):
-        test_name = match.group(1)
-        test_label = match.group(2)
-        test_refs.append((test_name, test_label))
+    # Links of one kind never overlap: a link starting inside the previous
+    # link of the same kind is skipped
+    param_end = req_end = test_end = 0
+
+    for match in _REFERENCE_RE.finditer(body):
+        start = match.start()
+
+        if start >= param_end and match.start('param_path') != -1:
+            param_refs.append((match['param_name'], match['param_path']))
+            param_end = match.end('param_path') + 1
+
+        if start >= req_end and match.start('req_url') != -1:
+            clean_path, version = _split_requirement_url(match['req_url'])
+            req_refs.append((match['req_id'], clean_path, version))
+            req_end = match.end('req_url') + 1
+
+        if start >= test_end and match.start('test_label') != -1:
+            test_refs.append((match['test_name'], match['test_label']))
+            test_end = match.end('test_label') + 1
 
     return param_refs, req_refs, test_refs
 
@@ -274,22 +423,15 @@ def validate_parameter_reference(param_name, param_path, workspace_root):
     # Convert to absolute path
     abs_path = os.path.join(workspace_root, file_path)
 
-    # Check if file exists
-    if not os.path.exists(abs_path):
-        return False, f"Parameter file does not exist: {file_path}"
-
     # Read file and check if parameter is defined
     try:
-        with open(abs_path, 'r') as f:
-            content = f.read()
-
-        # Look for parameter definition (simple check for the parameter name)
-        # In Starlark, parameters are defined like: "param_name": {...}
-        if f'"{anchor}"' in content or f"'{anchor}'" in content:
+        if _defines_parameter(abs_path, anchor):
             return True, None
         else:
             return False, f"Parameter '{anchor}' not found in {file_path}"
 
+    except FileNotFoundError:
+        return False, f"Parameter file does not exist: {file_path}"
     except Exception as e:
         return False, f"Error reading {file_path}: {e}"
 
@@ -306,29 +448,16 @@ def validate_requirement_reference(req_id, req_path, workspace_root, ref_version
 
     # Check that filename has valid extension
     filename = os.path.basename(path_without_fragment)
-    if not (filename.endswith('.md') or filename.endswith('.sysreq.md')):
+    if not filename.endswith(('.md', '.sysreq.md')):
         return False, f"Requirement file must have .md or .sysreq.md extension: {filename}"
 
     # Convert to absolute path
     abs_path = os.path.join(workspace_root, path_without_fragment)
 
-    # Check if file exists
-    if not os.path.exists(abs_path):
-        return False, f"Requirement file does not exist: {req_path}"
-
     # Read file and verify it contains the correct requirement ID
     try:
-        with open(abs_path, 'r') as f:
-            content = f.read()
-
-        # Try to parse frontmatter first (for traditional frontmatter style)
-        frontmatter, _ = parse_frontmatter(content)
-
-        # If no frontmatter, try parsing inline YAML block (for ## REQ-ID style)
-        if not frontmatter or frontmatter.get('id') != req_id:
-            frontmatter = parse_inline_yaml_for_requirement(content, req_id)
-
-        if not frontmatter or frontmatter.get('id') != req_id:
+        frontmatter = _find_requirement(os.path.normpath(abs_path), req_id)
+        if frontmatter is None:
             return False, f"Requirement file {req_path} does not contain ID '{req_id}'"
 
         # Check version if ref_version is specified
@@ -341,6 +470,8 @@ def validate_requirement_reference(req_id, req_path, workspace_root, ref_version
 
         return True, None
 
+    except FileNotFoundError:
+        return False, f"Requirement file does not exist: {req_path}"
     except Exception as e:
         return False, f"Error reading {req_path}: {e}"
 
@@ -365,23 +496,12 @@ def validate_test_reference(test_name, test_label, workspace_root):
             return False, f"Test link text '{test_name}' does not match target name '{target_name}' in {test_label}"
 
         # Check if BUILD.bazel or BUILD file exists in the package
-        build_file = None
-        for build_name in ['BUILD.bazel', 'BUILD']:
-            potential_path = os.path.join(workspace_root, package_path, build_name)
-            if os.path.exists(potential_path):
-                build_file = potential_path
-                break
-
+        build_file = _find_build_file(workspace_root, package_path)
         if not build_file:
             return False, f"No BUILD file found for package: //{package_path}"
 
-        # Read BUILD file and check if target name appears
-        with open(build_file, 'r') as f:
-            build_content = f.read()
-
-        # Simple check: target name should appear in BUILD file
-        # This is not perfect but avoids recursive Bazel invocation
-        if f'name = "{target_name}"' in build_content or f"name = '{target_name}'" in build_content:
+        # Check if target name appears in the BUILD file
+        if _defines_target(build_file, target_name):
             return True, None
         else:
             return False, f"Test target '{target_name}' not found in {build_file}"
@@ -390,20 +510,26 @@ def validate_test_reference(test_name, test_label, workspace_root):
         return False, f"Error validating test target {test_label}: {e}"
 
 
+def _is_sorted(items):
+    """Check that items are in ascending order without sorting them."""
+    return all(a <= b for a, b in zip(items, items[1:]))
+
+
 def validate_requirement_file(file_path, workspace_root):
     """Validate all cross-references in a single requirement file."""
     errors = []
 
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
+        content, frontmatter, body = _load(os.path.normpath(file_path))
     except Exception as e:
         return [f"Error reading {file_path}: {e}"]
 
-    frontmatter, body = parse_frontmatter(content)
-
     # Extract references from markdown body (even if no frontmatter)
     if not frontmatter:
+        # Without frontmatter only body links are checked, and every link
+        # kind contains "](" - a file without one has nothing to validate
+        if '](' not in content:
+            return errors
         body = content  # Use full content as body if no frontmatter
     param_refs, req_refs, test_refs = extract_markdown_references(body)
 
@@ -429,8 +555,8 @@ def validate_requirement_file(file_path, workspace_root):
                     sortable_items.append(item)
 
             # Check if sorted
-            sorted_items = sorted(sortable_items)
-            if sortable_items != sorted_items:
+            if not _is_sorted(sortable_items):
+                sorted_items = sorted(sortable_items)
                 errors.append(
                     f"{file_path}: Frontmatter '{ref_type}' references are not sorted lexicographically.\n"
                     f"  Current order: {sortable_items}\n"
@@ -459,74 +585,59 @@ def validate_requirement_file(file_path, workspace_root):
                     )
                     sortable_reqs.append(req_ref)
 
-            sorted_reqs = sorted(sortable_reqs)
-            if sortable_reqs != sorted_reqs:
+            if not _is_sorted(sortable_reqs):
+                sorted_reqs = sorted(sortable_reqs)
                 errors.append(
                     f"{file_path}: Frontmatter 'requirements' references are not sorted lexicographically.\n"
                     f"  Current order: {sortable_reqs}\n"
                     f"  Expected order: {sorted_reqs}"
                 )
 
-        # Extract parameters (handle both string and dict formats)
-        fm_params = set()
-        for param_ref in fm_refs.get('parameters', []):
-            if isinstance(param_ref, dict):
-                # Skip dict items for now (shouldn't happen for parameters)
-                continue
-            else:
-                fm_params.add(param_ref)
+        # Extract parameters (dict items are skipped; they shouldn't happen for parameters)
+        fm_params = {param_ref for param_ref in fm_refs.get('parameters', []) if not isinstance(param_ref, dict)}
 
         # Extract requirement paths from frontmatter (handle both string and dict formats)
-        fm_reqs = set()
-        for req_ref in fm_refs.get('requirements', []):
-            if isinstance(req_ref, dict):
-                fm_reqs.add(req_ref.get('path', ''))
-            else:
-                fm_reqs.add(req_ref)
+        fm_reqs = {
+            req_ref.get('path', '') if isinstance(req_ref, dict) else req_ref
+            for req_ref in fm_refs.get('requirements', [])
+        }
 
-        # Extract tests (handle both string and dict formats)
-        fm_tests = set()
-        for test_ref in fm_refs.get('tests', []):
-            if isinstance(test_ref, dict):
-                # Skip dict items for now (shouldn't happen for tests)
-                continue
-            else:
-                fm_tests.add(test_ref)
+        # Extract tests (dict items are skipped; they shouldn't happen for tests)
+        fm_tests = {test_ref for test_ref in fm_refs.get('tests', []) if not isinstance(test_ref, dict)}
 
         # Build sets of body references
-        body_params = set(param_path for _, param_path in param_refs)
-        body_reqs = set(req_path for _, req_path, _ in req_refs)
-        body_tests = set(test_label for _, test_label in test_refs)
+        body_params = {param_path for _, param_path in param_refs}
+        body_reqs = {req_path for _, req_path, _ in req_refs}
+        body_tests = {test_label for _, test_label in test_refs}
 
         # Check bi-directional consistency: all body refs must be in frontmatter
-        for param_path in body_params:
-            if param_path not in fm_params:
-                errors.append(f"{file_path}: Body references parameter '{param_path}' not declared in frontmatter")
+        for param_path in body_params - fm_params:
+            errors.append(f"{file_path}: Body references parameter '{param_path}' not declared in frontmatter")
 
-        for req_path in body_reqs:
-            if req_path not in fm_reqs:
-                errors.append(f"{file_path}: Body references requirement '{req_path}' not declared in frontmatter")
+        for req_path in body_reqs - fm_reqs:
+            errors.append(f"{file_path}: Body references requirement '{req_path}' not declared in frontmatter")
 
-        for test_label in body_tests:
-            if test_label not in fm_tests:
-                errors.append(f"{file_path}: Body references test '{test_label}' not declared in frontmatter")
+        for test_label in body_tests - fm_tests:
+            errors.append(f"{file_path}: Body references test '{test_label}' not declared in frontmatter")
 
         # Check reverse: all frontmatter refs must be used in body
-        for param_path in fm_params:
-            if param_path not in body_params:
-                errors.append(f"{file_path}: Frontmatter declares parameter '{param_path}' but it's not used in body")
+        for param_path in fm_params - body_params:
+            errors.append(f"{file_path}: Frontmatter declares parameter '{param_path}' but it's not used in body")
 
-        for req_path in fm_reqs:
-            if req_path and req_path not in body_reqs:
+        for req_path in fm_reqs - body_reqs:
+            if req_path:
                 errors.append(f"{file_path}: Frontmatter declares requirement '{req_path}' but it's not used in body")
 
-        for test_label in fm_tests:
-            if test_label not in body_tests:
-                errors.append(f"{file_path}: Frontmatter declares test '{test_label}' but it's not used in body")
+        for test_label in fm_tests - body_tests:
+            errors.append(f"{file_path}: Frontmatter declares test '{test_label}' but it's not used in body")
 
-    # Validate parameter references exist
-    for param_name, param_path in param_refs:
-        valid, error = validate_parameter_reference(param_name, param_path, workspace_root)
+    # Validate parameter references exist. A reference repeated in the body
+    # is checked once and reported at each occurrence.
+    param_results = {}
+    for param_ref in param_refs:
+        if param_ref not in param_results:
+            param_results[param_ref] = validate_parameter_reference(*param_ref, workspace_root)
+        valid, error = param_results[param_ref]
         if not valid:
             errors.append(f"{file_path}: {error}")
 
@@ -536,9 +647,12 @@ def validate_requirement_file(file_path, workspace_root):
         if not valid:
             errors.append(f"{file_path}: {error}")
 
-    # Validate test references exist
-    for test_name, test_label in test_refs:
-        valid, error = validate_test_reference(test_name, test_label, workspace_root)
+    # Validate test references exist, checking repeated references once
+    test_results = {}
+    for test_ref in test_refs:
+        if test_ref not in test_results:
+            test_results[test_ref] = validate_test_reference(*test_ref, workspace_root)
+        valid, error = test_results[test_ref]
         if not valid:
             errors.append(f"{file_path}: {error}")
 
@@ -560,9 +674,8 @@ def main():
         all_errors.extend(errors)
 
     if all_errors:
-        print("Cross-reference validation failed:")
-        for error in all_errors:
-            print(f"  ERROR: {error}")
+        # Emit the whole report with a single write
+        sys.stdout.write("Cross-reference validation failed:\n" + "".join(f"  ERROR: {error}\n" for error in all_errors))
         sys.exit(1)
     else:
         print(f"Cross-reference validation passed for {len(requirement_files)} requirement(s)")
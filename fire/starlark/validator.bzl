@@ -8,6 +8,13 @@ def _is_valid_identifier_char(c, allow_dot = False):
         return True
     return False
 
+def _is_identifier(s):
+    """Check if string is a letter or underscore followed by alphanumerics or underscores."""
+    if not s or (not s[0].isalpha() and s[0] != "_"):
+        return False
+    rest = s.replace("_", "")
+    return not rest or rest.isalnum()
+
 def _validate_namespace(namespace):
     """Validate namespace format.
 
@@ -17,16 +24,25 @@ def _validate_namespace(namespace):
     Returns:
         None if valid, error message if invalid
     """
+
+    # Common case: every dot-separated part is an identifier. The checks
+    # below only run to produce a specific error message.
+    if all([_is_identifier(part) for part in namespace.split(".")]):
+        return None
+
     if not namespace:
         return "namespace cannot be empty"
 
     if not namespace[0].isalpha() and namespace[0] != "_":
         return "namespace must start with letter or underscore"
 
-    # Check for valid characters
-    for i, c in enumerate(namespace.elems()):
-        if not _is_valid_identifier_char(c, allow_dot = True):
-            return "namespace contains invalid character '{}' at position {}".format(c, i)
+    # Check for valid characters. A single isalnum() over the namespace with
+    # separators removed covers the common case; the per-character scan only
+    # runs to locate the offending character.
+    if not namespace.replace(".", "").replace("_", "").isalnum():
+        for i, c in enumerate(namespace.elems()):
+            if not _is_valid_identifier_char(c, allow_dot = True):
+                return "namespace contains invalid character '{}' at position {}".format(c, i)
 
     # Check that dots are properly placed
     parts = namespace.split(".")
@@ -38,6 +54,16 @@ def _validate_namespace(namespace):
 
     return None
 
+# Valid parameter types, keyed for constant-time lookup and listed in this
+# order in error messages
+_VALID_TYPES = {
+    "float": True,
+    "integer": True,
+    "string": True,
+    "boolean": True,
+    "table": True,
+}
+
 def _validate_type(param_type):
     """Validate parameter type.
 
@@ -47,36 +73,54 @@ def _validate_type(param_type):
     Returns:
         None if valid, error message if invalid
     """
-    valid_types = ["float", "integer", "string", "boolean", "table"]
-    if param_type not in valid_types:
-        return "invalid type '{}'. Valid types: {}".format(param_type, ", ".join(valid_types))
+    if type(param_type) != "string" or param_type not in _VALID_TYPES:
+        return "invalid type '{}'. Valid types: {}".format(param_type, ", ".join(_VALID_TYPES.keys()))
     return None
 
-def _validate_value_type(value, expected_type, context):
+# Starlark type() name of a value of each parameter type. Float parameters
+# also accept integers; those cells take the per-cell path.
+_VALUE_TYPE_NAMES = {
+    "boolean": "bool",
+    "float": "float",
+    "integer": "int",
+    "string": "string",
+}
+
+# Allowed Starlark type() names and error description for each value type
+_VALUE_TYPE_CHECKS = {
+    "boolean": (["bool"], "a boolean"),
+    "float": (["int", "float"], "a number"),
+    "integer": (["int"], "an integer"),
+    "string": (["string"], "a string"),
+}
+
+# Context for table cell errors, formatted only when a cell is invalid
+_TABLE_CELL_CONTEXT = "table parameter '{}' row {} column {}"
+
+def _validate_value_type(value, expected_type, context, *context_args):
     """Validate that a value matches its expected type.
 
     Args:
         value: The value to check
         expected_type: Expected type string
-        context: Context string for error messages
+        context: Context format string for error messages
+        *context_args: Arguments for the context format string
 
     Returns:
         None if valid, error message if invalid
     """
-    value_type = type(value)
+    check = _VALUE_TYPE_CHECKS.get(expected_type)
+    if not check:
+        return None
 
-    if expected_type == "float":
-        if value_type not in ["int", "float"]:
-            return "{} must be a number (got {})".format(context, value_type)
-    elif expected_type == "integer":
-        if value_type != "int":
-            return "{} must be an integer (got {})".format(context, value_type)
-    elif expected_type == "string":
-        if value_type != "string":
-            return "{} must be a string (got {})".format(context, value_type)
-    elif expected_type == "boolean":
-        if value_type != "bool":
-            return "{} must be a boolean (got {})".format(context, value_type)
+    allowed_types, description = check
+    value_type = type(value)
+    if value_type not in allowed_types:
+        return "{} must be {} (got {})".format(
+            context.format(*context_args),
+            description,
+            value_type,
+        )
 
     return None
 
@@ -121,6 +165,15 @@ def _validate_table_parameter(param):
         return "table parameter '{}' rows must be a list".format(param_name)
 
     expected_cols = len(columns)
+
+    # Cell types of a row that needs no per-cell checks
+    row_signature = [_VALUE_TYPE_NAMES[col["type"]] for col in columns]
+
+    # Float columns also accept integers, which is common in numeric tables
+    # written with literals like 10 instead of 10.0
+    float_columns = [col["type"] == "float" for col in columns]
+    has_float_columns = True in float_columns
+
     for row_idx, row in enumerate(rows):
         if type(row) != "list":
             return "table parameter '{}' row {} must be a list".format(param_name, row_idx)
@@ -133,10 +186,28 @@ def _validate_table_parameter(param):
                 expected_cols,
             )
 
+        # Whole-row check first; only mismatching rows are inspected per cell
+        row_types = [type(cell_value) for cell_value in row]
+        if row_types == row_signature:
+            continue
+        if has_float_columns and "int" in row_types:
+            widened_types = [
+                "float" if is_float and cell_type == "int" else cell_type
+                for cell_type, is_float in zip(row_types, float_columns)
+            ]
+            if widened_types == row_signature:
+                continue
+
         # Validate each cell value
         for col_idx, (cell_value, col_def) in enumerate(zip(row, columns)):
-            context = "table parameter '{}' row {} column {}".format(param_name, row_idx, col_idx)
-            err = _validate_value_type(cell_value, col_def["type"], context)
+            err = _validate_value_type(
+                cell_value,
+                col_def["type"],
+                _TABLE_CELL_CONTEXT,
+                param_name,
+                row_idx,
+                col_idx,
+            )
             if err:
                 return err
 
@@ -173,11 +244,10 @@ def _validate_parameter(param, index):
         if "value" not in param:
             return "parameter '{}' must have a 'value' field".format(param["name"])
 
-        context = "parameter '{}'".format(param["name"])
-        return _validate_value_type(param["value"], param_type, context)
+        return _validate_value_type(param["value"], param_type, "parameter '{}'", param["name"])
 
-def validate_parameters(param_data):
-    """Validate a parameter data structure.
+def validate_header(param_data):
+    """Validate the top-level fields of a parameter data structure.
 
     Args:
         param_data: Dictionary with parameter data
@@ -198,27 +268,60 @@ def validate_parameters(param_data):
         return err
 
     # Validate parameters list
-    parameters = param_data["parameters"]
-    if type(parameters) != "list":
+    if type(param_data["parameters"]) != "list":
         return "parameters must be a list"
 
+    return None
+
+def validate_parameter(param, index, seen_names):
+    """Validate a single parameter and check its name is unique.
+
+    Args:
+        param: Parameter dictionary
+        index: Index in parameters list (for error messages)
+        seen_names: Dictionary of names already validated; updated in place
+
+    Returns:
+        None if valid, error message if invalid
+    """
+    err = _validate_parameter(param, index)
+    if err:
+        return err
+
+    # Check for duplicate names
+    param_name = param["name"]
+    if param_name in seen_names:
+        return "duplicate parameter name: {}".format(param_name)
+    seen_names[param_name] = True
+
+    return None
+
+def validate_parameters(param_data):
+    """Validate a parameter data structure.
+
+    Args:
+        param_data: Dictionary with parameter data
+
+    Returns:
+        None if valid, error message if invalid
+    """
+    err = validate_header(param_data)
+    if err:
+        return err
+
     # Track parameter names for duplicate checking
     seen_names = {}
 
-    for index, param in enumerate(parameters):
-        err = _validate_parameter(param, index)
+    for index, param in enumerate(param_data["parameters"]):
+        err = validate_parameter(param, index, seen_names)
         if err:
             return err
 
-        # Check for duplicate names
-        param_name = param["name"]
-        if param_name in seen_names:
-            return "duplicate parameter name: {}".format(param_name)
-        seen_names[param_name] = True
-
     return None
 
-# Export validation function
+# Export validation functions
 validator = struct(
     validate = validate_parameters,
+    validate_header = validate_header,
+    validate_parameter = validate_parameter,
 )
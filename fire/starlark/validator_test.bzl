@@ -102,66 +102,41 @@ def _test_valid_simple_parameters(ctx):
     """Test valid simple parameters."""
     env = unittest.begin(ctx)
 
-    # Float parameter
-    err = validator.validate({
-        "namespace": "test",
-        "parameters": [
-            {
-                "description": "Maximum velocity",
-                "name": "max_velocity",
-                "type": "float",
-                "unit": "m/s",
-                "value": 55.0,
-            },
-        ],
-        "schema_version": "1.0",
-    })
-    asserts.equals(env, None, err)
-
-    # Integer parameter
-    err = validator.validate({
-        "namespace": "test",
-        "parameters": [
-            {
-                "description": "Number of wheels",
-                "name": "wheel_count",
-                "type": "integer",
-                "value": 4,
-            },
-        ],
-        "schema_version": "1.0",
-    })
-    asserts.equals(env, None, err)
-
-    # String parameter
-    err = validator.validate({
-        "namespace": "test",
-        "parameters": [
-            {
-                "description": "Vehicle model name",
-                "name": "vehicle_model",
-                "type": "string",
-                "value": "Model X",
-            },
-        ],
-        "schema_version": "1.0",
-    })
-    asserts.equals(env, None, err)
-
-    # Boolean parameter
-    err = validator.validate({
-        "namespace": "test",
-        "parameters": [
-            {
-                "description": "Has ABS system",
-                "name": "has_abs",
-                "type": "boolean",
-                "value": True,
-            },
-        ],
-        "schema_version": "1.0",
-    })
-    asserts.equals(env, None, err)
+    valid_params = [
+        {
+            "description": "Maximum velocity",
+            "name": "max_velocity",
+            "type": "float",
+            "unit": "m/s",
+            "value": 55.0,
+        },
+        {
+            "description": "Number of wheels",
+            "name": "wheel_count",
+            "type": "integer",
+            "value": 4,
+        },
+        {
+            "description": "Vehicle model name",
+            "name": "vehicle_model",
+            "type": "string",
+            "value": "Model X",
+        },
+        {
+            "description": "Has ABS system",
+            "name": "has_abs",
+            "type": "boolean",
+            "value": True,
+        },
+    ]
+
+    for param in valid_params:
+        err = validator.validate({
+            "namespace": "test",
+            "parameters": [param],
+            "schema_version": "1.0",
+        })
+        asserts.equals(env, None, err, "{} parameter should be valid".format(param["type"]))
 
     return unittest.end(env)
 
@@ -169,50 +144,43 @@ def _test_invalid_parameter_types(ctx):
     """Test invalid parameter types."""
     env = unittest.begin(ctx)
 
-    # Invalid type name
-    err = validator.validate({
-        "namespace": "test",
-        "parameters": [
+    invalid_params = [
+        (
             {
                 "description": "Test",
                 "name": "value",
                 "type": "double",
                 "value": 1.0,
             },
-        ],
-        "schema_version": "1.0",
-    })
-    asserts.true(env, err != None, "Invalid type should fail")
-
-    # Float value for integer type
-    err = validator.validate({
-        "namespace": "test",
-        "parameters": [
+            "Invalid type should fail",
+        ),
+        (
             {
                 "description": "Test",
                 "name": "count",
                 "type": "integer",
                 "value": 1.5,
             },
-        ],
-        "schema_version": "1.0",
-    })
-    asserts.true(env, err != None, "Float value for integer type should fail")
-
-    # String value for float type
-    err = validator.validate({
-        "namespace": "test",
-        "parameters": [
+            "Float value for integer type should fail",
+        ),
+        (
             {
                 "description": "Test",
                 "name": "value",
                 "type": "float",
                 "value": "not a number",
             },
-        ],
-        "schema_version": "1.0",
-    })
-    asserts.true(env, err != None, "String value for float type should fail")
+            "String value for float type should fail",
+        ),
+    ]
+
+    for param, msg in invalid_params:
+        err = validator.validate({
+            "namespace": "test",
+            "parameters": [param],
+            "schema_version": "1.0",
+        })
+        asserts.true(env, err != None, msg)
 
     return unittest.end(env)
 
@@ -382,6 +350,62 @@ def _test_invalid_table_parameters(ctx):
 
     return unittest.end(env)
 
+def _test_table_cell_types(ctx):
+    """Test table cell type checks, including integers in float columns."""
+    env = unittest.begin(ctx)
+
+    columns = [
+        {"name": "gear", "type": "integer"},
+        {"name": "ratio", "type": "float"},
+        {"name": "label", "type": "string"},
+    ]
+
+    test_cases = [
+        # Integer literal in a float column is accepted
+        ([[1, 3.5, "first"], [2, 2, "second"]], None),
+        # Booleans are neither numbers nor integers
+        (
+            [[1, 3.5, "first"], [2, True, "second"]],
+            "table parameter 'gear_ratios' row 1 column 1 must be a number (got bool)",
+        ),
+        (
+            [[False, 3.5, "first"]],
+            "table parameter 'gear_ratios' row 0 column 0 must be an integer (got bool)",
+        ),
+        # Float in an integer column is not widened
+        (
+            [[1.0, 3.5, "first"]],
+            "table parameter 'gear_ratios' row 0 column 0 must be an integer (got float)",
+        ),
+        # Mixed-type row falls back to the per-cell error for the first bad cell
+        (
+            [[1, 3.5, "first"], [2, 2, 3]],
+            "table parameter 'gear_ratios' row 1 column 2 must be a string (got int)",
+        ),
+        (
+            [["2", "fast", 3]],
+            "table parameter 'gear_ratios' row 0 column 0 must be an integer (got string)",
+        ),
+    ]
+
+    for rows, expected in test_cases:
+        err = validator.validate({
+            "namespace": "test",
+            "parameters": [
+                {
+                    "columns": columns,
+                    "description": "Gear ratios",
+                    "name": "gear_ratios",
+                    "rows": rows,
+                    "type": "table",
+                },
+            ],
+            "schema_version": "1.0",
+        })
+        asserts.equals(env, expected, err)
+
+    return unittest.end(env)
+
 def _test_duplicate_parameter_names(ctx):
     """Test duplicate parameter names."""
     env = unittest.begin(ctx)
@@ -417,6 +441,7 @@ invalid_parameter_types_test = unittest.make(_test_invalid_parameter_types)
 missing_parameter_fields_test = unittest.make(_test_missing_parameter_fields)
 valid_table_parameters_test = unittest.make(_test_valid_table_parameters)
 invalid_table_parameters_test = unittest.make(_test_invalid_table_parameters)
+table_cell_types_test = unittest.make(_test_table_cell_types)
 duplicate_parameter_names_test = unittest.make(_test_duplicate_parameter_names)
 
 def validator_test_suite(name):
@@ -431,5 +456,6 @@ def validator_test_suite(name):
         missing_parameter_fields_test,
         valid_table_parameters_test,
         invalid_table_parameters_test,
+        table_cell_types_test,
         duplicate_parameter_names_test,
     )